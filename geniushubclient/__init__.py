@@ -8,10 +8,15 @@ import logging
 import re
 from datetime import datetime
 from hashlib import sha256
-from typing import Dict, List, Optional  # Any, Set, Tuple
+from typing import Dict, List, Optional, Tuple  # Any, Set
 
 import aiohttp
 
+try:  # orjson is optional, but much faster at decoding the (large) v3 payloads
+    from orjson import loads as json_loads  # pylint: disable=import-error
+except ImportError:
+    json_loads = json.loads
+
 from .const import (
     ATTRS_DEVICE,
     ATTRS_ZONE,
@@ -27,7 +32,6 @@ from .const import (
     ITYPE_TO_TYPE,
     MODE_TO_IMODE,
     STATE_ATTRS,
-    TYPE_TO_ITYPE,
     ZONE_KIT,
     ZONE_MODE,
     ZONE_TYPE,
@@ -36,6 +40,14 @@ from .const import (
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
 _LOGGER = logging.getLogger(__name__)
 
+_HTTP_METHODS = frozenset(("GET", "PATCH", "POST", "PUT"))
+
+_TYPES_WITH_TEMP = frozenset((ZONE_TYPE.ControlSP, ZONE_TYPE.TPI))
+_TYPES_WITH_OVERRIDE = frozenset(
+    (ZONE_TYPE.OnOffTimer, ZONE_TYPE.ControlSP, ZONE_TYPE.TPI)
+)
+_TYPES_WITHOUT_TIMER = frozenset((ZONE_TYPE.Manager, ZONE_TYPE.Surrogate))
+
 DEBUG_LOGGING = False
 DEBUG_MODE = False
 DEBUG_NO_SCHEDULES = False
@@ -52,6 +64,38 @@ if DEBUG_MODE is True:
     _LOGGER.debug("Debugger is attached!")
 
 
+_DEFAULT_SESSIONS = {}  # event loop -> session shared by hubs without their own
+
+
+def get_default_session() -> aiohttp.ClientSession:
+    """Return the session shared by hubs without their own, for the running loop.
+
+      Must be called from within a coroutine (so that get_event_loop() returns the
+      running loop). The sessions of any loops that have since been closed are
+      abandoned, not closed: they can no longer be closed once their loop is.
+    """
+    loop = asyncio.get_event_loop()
+
+    for stale_loop in [k for k in _DEFAULT_SESSIONS if k.is_closed()]:
+        del _DEFAULT_SESSIONS[stale_loop]
+
+    session = _DEFAULT_SESSIONS.get(loop)
+    if session is None or session.closed:
+        session = _DEFAULT_SESSIONS[loop] = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ttl_dns_cache=300, keepalive_timeout=75, enable_cleanup_closed=True
+            )
+        )
+    return session
+
+
+async def close_default_session() -> None:
+    """Close the shared session of the running loop (if any)."""
+    session = _DEFAULT_SESSIONS.pop(asyncio.get_event_loop(), None)
+    if session is not None:
+        await session.close()
+
+
 def natural_sort(dict_list, dict_key) -> List[Dict]:
     """Return a case-insensitively sorted list with '11' after '2-2'."""
 
@@ -64,6 +108,17 @@ def natural_sort(dict_list, dict_key) -> List[Dict]:
     return sorted(dict_list, key=_alphanum_key)
 
 
+def _keys_by_verbosity(object_attrs) -> Dict[int, frozenset]:
+    """Return the keys that .info exposes at verbosity 0 and 1."""
+    summary_keys = frozenset(object_attrs["summary_keys"])
+    return {0: summary_keys, 1: summary_keys | frozenset(object_attrs["detail_keys"])}
+
+
+def _v3_password_digest(username, password) -> str:
+    """Return the hashed password used by the v3 API (for BasicAuth)."""
+    return sha256((username + password).encode("utf-8")).hexdigest()
+
+
 def _zones_via_v3_zones(raw_json) -> List[Dict]:
     """Extract Zones from /v3/zones JSON."""
     return raw_json["data"]
@@ -72,17 +127,17 @@ def _zones_via_v3_zones(raw_json) -> List[Dict]:
 def _devices_via_v3_data_mgr(raw_json) -> List[Dict]:
     """Extract Devices from /v3/data_manager JSON."""
     result = []
-    for site in [
-        x for x in raw_json["data"]["childNodes"].values() if x["addr"] != "WeatherData"
-    ]:
-        for device in [x for x in site["childNodes"].values() if x["addr"] != "1"]:
-            result.append(device)
-            for channel in [
-                x for x in device["childNodes"].values() if x["addr"] != "_cfg"
-            ]:
-                temp = dict(channel)
-                temp["addr"] = f"{device['addr']}-{channel['addr']}"
-                result.append(temp)
+    append = result.append
+    for site in raw_json["data"]["childNodes"].values():
+        if site["addr"] == "WeatherData":
+            continue
+        for device in site["childNodes"].values():
+            if device["addr"] == "1":
+                continue
+            append(device)
+            for channel in device["childNodes"].values():
+                if channel["addr"] != "_cfg":
+                    append(dict(channel, addr=f"{device['addr']}-{channel['addr']}"))
     return result
 
 
@@ -107,8 +162,102 @@ def _version_via_v3_zones(raw_json) -> str:
             return HUB_SW_VERSIONS[date_time_idx]
 
 
+def _is_occupied(node) -> bool:  # from web app v5.2.4
+    """Occupancy vs Activity (code from app.js, search for 'occupancyIcon').
+
+        R = occupancy not detected (valid in any mode)
+        O = occupancy detected (valid in any mode)
+        A = occupancy detected, sufficient to call for heat (iff in Sense/FP mode)
+
+        l = null != i.settings.experimentalFeatures && i.settings.experimentalFeatures.timerPlus,
+        p = parseInt(n.iMode) === e.zoneModes.Mode_Footprint || l,           # in FP/sense mode
+        u = parseInt(n.iFlagExpectedKit) & e.equipmentTypes.Kit_PIR,         # has a PIR
+        d = n.trigger.reactive && n.trigger.output,                          #
+        c = parseInt(n.zoneReactive.fActivityLevel) || 0,
+        s = t.isInFootprintNightMode(n),                                     # night time
+
+        occupancyIcon() = p && u && d && !s ? a : c > 0 ? o : r
+
+        Hint: the following returns "XX">> true ? "XX" : "YY"
+    """
+    # pylint: disable=invalid-name
+    A = O = True  # noqa: E741
+    R = False
+
+    l = True  # noqa: E741                                         TODO: WIP
+    p = node["iMode"] == ZONE_MODE.Footprint | l  # #                    Checked
+    u = node["iFlagExpectedKit"] & ZONE_KIT.PIR  # #                     Checked
+    d = node["trigger"]["reactive"] & node["trigger"]["output"]  # #     Checked
+    c = node["zoneReactive"]["fActivityLevel"]  # # needs int()?   TODO: WIP
+    s = node["objFootprint"]["bIsNight"]  # #                      TODO: WIP
+
+    return A if p and u and d and (not s) else (O if c > 0 else R)
+
+
+def _timer_schedule(raw_json) -> Dict:
+    """Return the (v1) timer schedule of a zone from its v3 JSON."""
+    root = {"weekly": {}}
+    day = -1
+
+    setpoints = raw_json["objTimer"]
+    for idx, setpoint in enumerate(setpoints):
+        tm_next = setpoint["iTm"]
+        sp_next = setpoint["fSP"]
+        if raw_json["iType"] == ZONE_TYPE.OnOffTimer:
+            sp_next = bool(sp_next)
+
+        if setpoint["iDay"] > day:
+            day += 1
+            node = root["weekly"][IDAY_TO_DAY[day]] = {}
+            node["defaultSetpoint"] = sp_next
+            node["heatingPeriods"] = []
+
+        elif sp_next != node["defaultSetpoint"]:
+            tm_last = setpoints[idx + 1]["iTm"]
+            # reactive = self._hub._sense_mode & bool(setpoint.get("bReactive"))
+
+            node["heatingPeriods"].append(
+                {"end": tm_last, "start": tm_next, "setpoint": sp_next}
+            )
+
+    return root
+
+
+def _footprint_schedule(raw_json) -> Dict:
+    """Return the (v1) footprint schedule of a zone from its v3 JSON."""
+    root = {"weekly": {}}
+    day = -1
+
+    setpoints = raw_json["objFootprint"]
+    for idx, setpoint in enumerate(setpoints["lstSP"]):
+        tm_next = setpoint["iTm"]
+        sp_next = setpoint["fSP"]
+
+        if setpoint["iDay"] > day:
+            day += 1
+            node = root["weekly"][IDAY_TO_DAY[day]] = {}
+            node["defaultSetpoint"] = setpoints["fFootprintAwaySP"]
+            node["heatingPeriods"] = []
+
+        if sp_next != setpoints["fFootprintAwaySP"]:
+            if tm_next == setpoints["iFootprintTmNightStart"]:
+                tm_last = 86400  # 24 * 60 * 60
+            else:
+                tm_last = setpoints["lstSP"][idx + 1]["iTm"]
+
+            node["heatingPeriods"].append(
+                {"end": tm_last, "start": tm_next, "setpoint": sp_next}
+            )
+
+    return root
+
+
 class GeniusHub:
-    """The class for a connection to a Genius Hub."""
+    """The class for a connection to a Genius Hub.
+
+      If no session is given, the hub uses one that is shared with any other such
+      hubs on the same event loop: see close_default_session().
+    """
 
     def __init__(
         self, hub_id, username=None, password=None, session=None, debug=False
@@ -121,7 +270,7 @@ class GeniusHub:
                 "Debug mode is not explicitly enabled (but may be enabled elsewhere)."
             )
 
-        self._session = session if session else aiohttp.ClientSession()
+        self._session = session  # if None, get_default_session() is used
 
         self.api_version = 3 if username or password else 1
         if self.api_version == 1:
@@ -130,14 +279,16 @@ class GeniusHub:
             self._headers = {"authorization": f"Bearer {hub_id}"}
             self._timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT_V1)
         else:  # self.api_version == 3
-            sha = sha256()
-            sha.update((username + password).encode("utf-8"))
-            self._auth = aiohttp.BasicAuth(login=username, password=sha.hexdigest())
+            self._auth = aiohttp.BasicAuth(
+                login=username, password=_v3_password_digest(username, password)
+            )
             self._url_base = f"http://{hub_id}:1223/v3/"
-            self._headers = {"Connection": "close"}
+            self._headers = {}  # keep-alive, request() retries dropped connections
             self._timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT_V3)
 
         self._verbose = 1
+        self._update_count = 0  # bumped by _update(), used to invalidate caches
+        self._info_cache = {}
 
         self._sense_mode = None
         self._zones = self._devices = self._issues = self._version = None
@@ -174,37 +325,31 @@ class GeniusHub:
         """Perform a request."""
         _LOGGER.debug("_request(method=%s, url=%s, data=%s)", method, url, data)
 
-        http_method = {
-            "GET": self._session.get,
-            "PATCH": self._session.patch,
-            "POST": self._session.post,
-            "PUT": self._session.put,
-        }.get(method)
-
-        try:
-            async with http_method(
-                self._url_base + url,
-                auth=self._auth,
-                headers=self._headers,
-                json=data,
-                raise_for_status=True,
-                timeout=self._timeout,
-            ) as resp:
-                response = await resp.json(content_type=None)
-
-        except aiohttp.ServerDisconnectedError as err:
-            _LOGGER.debug(
-                "_request(): ServerDisconnectedError (msg=%s), retrying.", err
-            )
-            async with http_method(
-                self._url_base + url,
-                auth=self._auth,
-                headers=self._headers,
-                json=data,
-                raise_for_status=True,
-                timeout=self._timeout,
-            ) as resp:
-                response = await resp.json(content_type=None)
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"{method} is not a valid HTTP method.")
+        session = self._session if self._session else get_default_session()
+        http_method = getattr(session, method.lower())
+        kwargs = {  # the same for the first attempt and any retry
+            "auth": self._auth,
+            "headers": self._headers,
+            "json": data,
+            "raise_for_status": True,
+            "timeout": self._timeout,
+        }
+        url = self._url_base + url
+
+        for attempt in range(2):  # retry (once) if the hub dropped the connection
+            try:
+                async with http_method(url, **kwargs) as resp:
+                    response = await resp.json(loads=json_loads, content_type=None)
+                break
+
+            except aiohttp.ServerDisconnectedError as err:
+                if attempt:
+                    raise
+                _LOGGER.debug(
+                    "_request(): ServerDisconnectedError (msg=%s), retrying.", err
+                )
 
         if method != "GET":
             _LOGGER.debug("_request(): response=%s", response)
@@ -218,7 +363,7 @@ class GeniusHub:
           v1/zones:         id, name, type, mode, temperature, setpoint,
           occupied, override, schedule
         """
-        return [z.info for z in self.zone_objs]
+        return self._cached_info("zones", lambda: [z.info for z in self.zone_objs])
 
     @property
     def devices(self) -> List:
@@ -228,16 +373,38 @@ class GeniusHub:
           v1/devices:         id, type, assignedZones, state
         """
         key = "addr" if self.verbosity == 3 else "id"
-        return natural_sort([d.info for d in self.device_objs], key)
+        return self._cached_info(
+            "devices", lambda: natural_sort([d.info for d in self.device_objs], key)
+        )
+
+    def _cached_info(self, name, build_info) -> List:
+        """Return a copy of a cached list of entity info, rebuilt only when stale.
+
+          The list is copied, but the dicts within it are shared between reads.
+        """
+        key = (self._update_count, self._verbose)
+        try:
+            cache_key, info = self._info_cache[name]
+        except KeyError:
+            pass
+        else:
+            if cache_key == key:
+                return list(info)
+
+        info = build_info()
+        self._info_cache[name] = (key, info)
+        return list(info)
 
     async def _update(self):
         """Update the Hub with its latest state data."""
+        self._update_count += 1
 
         def populate_objects(
             obj_list, obj_key, obj_by_id, ObjectClass
-        ) -> List:  # pylint: disable=invalid-name
-            """Create the current list of GeniusHub objects (zones/devices)."""
+        ) -> Tuple[List, Dict]:  # pylint: disable=invalid-name
+            """Create the current list (and index) of GeniusHub objects."""
             entities = []  # list of converted zones/devices
+            entities_by_id = {}
             key = "id" if self.api_version == 1 else obj_key
             for raw_json in obj_list:
                 try:  # does the hub already know about this zone/device?
@@ -247,7 +414,8 @@ class GeniusHub:
                 else:
                     entity._convert(raw_json)  # pylint: disable=protected-access
                 entities.append(entity)
-            return entities
+                entities_by_id[entity.id] = entity
+            return entities, entities_by_id
 
         def convert_issue(raw_json) -> Dict:
             """Convert a issues's v3 JSON to the v1 schema."""
@@ -275,24 +443,25 @@ class GeniusHub:
         if self.api_version == 1:
             self._sense_mode = None  # currently, no way to tell
         else:  # self.api_version == 3:
-            manager = [z for z in self._zones if z["iID"] == 0][0]
+            manager = next(z for z in self._zones if z["iID"] == 0)
             self._sense_mode = bool(manager["lOptions"] & ZONE_MODE.Other)
 
-        zones = self.zone_objs = populate_objects(
+        zones, self.zone_by_id = populate_objects(
             self._zones, "iID", self.zone_by_id, GeniusZone
         )
-        devices = self.device_objs = populate_objects(
+        devices, self.device_by_id = populate_objects(
             self._devices, "addr", self.device_by_id, GeniusDevice
         )
+        self.zone_objs, self.device_objs = zones, devices
+        self.zone_by_name = {z.name: z for z in zones}
 
-        self.zone_by_id = {z.id: z for z in self.zone_objs}
-        self.zone_by_name = {z.name: z for z in self.zone_objs}
-        self.device_by_id = {d.id: d for d in self.device_objs}
+        devices_by_zone_name = {}  # a single pass, rather than one per zone
+        for device in devices:
+            zone_name = device.data["assignedZones"][0]["name"]
+            devices_by_zone_name.setdefault(zone_name, []).append(device)
 
         for zone in zones:  # TODO: this need checking
-            zone.device_objs = [
-                d for d in devices if d.data["assignedZones"][0]["name"] == zone.name
-            ]
+            zone.device_objs = devices_by_zone_name.get(zone.name, [])
             zone.device_by_id = {d.id: d for d in zone.device_objs}
 
         old_issues = self.issues
@@ -366,17 +535,19 @@ class GeniusTestHub(GeniusHub):
 class GeniusObject:
     """The base class for any Genius object: Zone, Device or Issue."""
 
-    def __init__(self, hub, object_attrs) -> None:
+    __slots__ = ("_hub", "_raw", "data", "id")
+
+    _info_keys = {0: frozenset(), 1: frozenset()}
+
+    def __init__(self, hub) -> None:
         self._hub = hub
-        self._attrs = object_attrs
 
         self.data = {}
         self._raw = {}
 
     def __repr__(self) -> str:
-        return json.dumps(
-            {k: v for k, v in self.data.items() if k in self._attrs["summary_keys"]}
-        )
+        keys = self._info_keys[0]
+        return json.dumps({k: v for k, v in self.data.items() if k in keys})
 
     @property
     def info(self) -> Dict:
@@ -391,18 +562,19 @@ class GeniusObject:
         if self._hub.verbosity == 2:
             return self.data
 
-        keys = self._attrs["summary_keys"]
-        if self._hub.verbosity == 1:
-            keys += self._attrs["detail_keys"]
-
+        keys = self._info_keys[self._hub.verbosity]
         return {k: v for k, v in self.data.items() if k in keys}
 
 
 class GeniusZone(GeniusObject):
     """The class for a Genius Zone."""
 
+    __slots__ = ("device_objs", "device_by_id")
+
+    _info_keys = _keys_by_verbosity(ATTRS_ZONE)
+
     def __init__(self, zone_id, raw_json, hub) -> None:
-        super().__init__(hub, ATTRS_ZONE)
+        super().__init__(hub)
 
         self.id = zone_id  # pylint: disable=invalid-name
 
@@ -418,141 +590,51 @@ class GeniusZone(GeniusObject):
             self.data = raw_json
             return
 
-        def _is_occupied(node) -> bool:  # from web app v5.2.4
-            """Occupancy vs Activity (code from app.js, search for 'occupancyIcon').
-
-                R = occupancy not detected (valid in any mode)
-                O = occupancy detected (valid in any mode)
-                A = occupancy detected, sufficient to call for heat (iff in Sense/FP mode)
-
-                l = null != i.settings.experimentalFeatures && i.settings.experimentalFeatures.timerPlus,
-                p = parseInt(n.iMode) === e.zoneModes.Mode_Footprint || l,           # in FP/sense mode
-                u = parseInt(n.iFlagExpectedKit) & e.equipmentTypes.Kit_PIR,         # has a PIR
-                d = n.trigger.reactive && n.trigger.output,                          #
-                c = parseInt(n.zoneReactive.fActivityLevel) || 0,
-                s = t.isInFootprintNightMode(n),                                     # night time
-
-                occupancyIcon() = p && u && d && !s ? a : c > 0 ? o : r
-
-                Hint: the following returns "XX">> true ? "XX" : "YY"
-            """
-            # pylint: disable=invalid-name
-            A = O = True  # noqa: E741
-            R = False
-
-            l = True  # noqa: E741                                         TODO: WIP
-            p = node["iMode"] == ZONE_MODE.Footprint | l  # #                    Checked
-            u = node["iFlagExpectedKit"] & ZONE_KIT.PIR  # #                     Checked
-            d = node["trigger"]["reactive"] & node["trigger"]["output"]  # #     Checked
-            c = node["zoneReactive"]["fActivityLevel"]  # # needs int()?   TODO: WIP
-            s = node["objFootprint"]["bIsNight"]  # #                      TODO: WIP
-
-            return A if p and u and d and (not s) else (O if c > 0 else R)
-
-        def _timer_schedule(raw_json) -> Dict:
-            root = {"weekly": {}}
-            day = -1
-
-            setpoints = raw_json["objTimer"]
-            for idx, setpoint in enumerate(setpoints):
-                tm_next = setpoint["iTm"]
-                sp_next = setpoint["fSP"]
-                if raw_json["iType"] == ZONE_TYPE.OnOffTimer:
-                    sp_next = bool(sp_next)
-
-                if setpoint["iDay"] > day:
-                    day += 1
-                    node = root["weekly"][IDAY_TO_DAY[day]] = {}
-                    node["defaultSetpoint"] = sp_next
-                    node["heatingPeriods"] = []
-
-                elif sp_next != node["defaultSetpoint"]:
-                    tm_last = setpoints[idx + 1]["iTm"]
-                    # reactive = self._hub._sense_mode & bool(setpoint.get("bReactive"))
-
-                    node["heatingPeriods"].append(
-                        {"end": tm_last, "start": tm_next, "setpoint": sp_next}
-                    )
-
-            return root
-
-        def _footprint_schedule(raw_json) -> Dict:
-            root = {"weekly": {}}
-            day = -1
-
-            setpoints = raw_json["objFootprint"]
-            for idx, setpoint in enumerate(setpoints["lstSP"]):
-                tm_next = setpoint["iTm"]
-                sp_next = setpoint["fSP"]
-
-                if setpoint["iDay"] > day:
-                    day += 1
-                    node = root["weekly"][IDAY_TO_DAY[day]] = {}
-                    node["defaultSetpoint"] = setpoints["fFootprintAwaySP"]
-                    node["heatingPeriods"] = []
-
-                if sp_next != setpoints["fFootprintAwaySP"]:
-                    if tm_next == setpoints["iFootprintTmNightStart"]:
-                        tm_last = 86400  # 24 * 60 * 60
-                    else:
-                        tm_last = setpoints["lstSP"][idx + 1]["iTm"]
-
-                    node["heatingPeriods"].append(
-                        {"end": tm_last, "start": tm_next, "setpoint": sp_next}
-                    )
-
-            return root
-
         self.data = result = {}
         result["id"] = raw_json["iID"]
         result["name"] = raw_json["strName"]
+        zone_type = None  # if it is missing, the KeyError is logged below
 
         try:
-            result["type"] = ITYPE_TO_TYPE[raw_json["iType"]]
-            if raw_json["iType"] == ZONE_TYPE.TPI and raw_json["zoneSubType"] == 0:
+            zone_type = raw_json["iType"]
+            result["type"] = ITYPE_TO_TYPE[zone_type]
+            if zone_type == ZONE_TYPE.TPI and raw_json["zoneSubType"] == 0:
                 result["type"] = ITYPE_TO_TYPE[ZONE_TYPE.ControlOnOffPID]
 
             result["mode"] = IMODE_TO_MODE[raw_json["iMode"]]
 
-            if raw_json["iType"] in [ZONE_TYPE.ControlSP, ZONE_TYPE.TPI]:
+            if zone_type in _TYPES_WITH_TEMP:
                 # some zones have a fPV without raw_json["activeTemperatureDevices"]
                 result["temperature"] = raw_json["fPV"]
                 result["setpoint"] = raw_json["fSP"]
 
-            if raw_json["iType"] == ZONE_TYPE.Manager:
+            if zone_type == ZONE_TYPE.Manager:
                 if raw_json["fPV"]:
                     result["temperature"] = raw_json["fPV"]
 
-            elif raw_json["iType"] == ZONE_TYPE.OnOffTimer:
+            elif zone_type == ZONE_TYPE.OnOffTimer:
                 result["setpoint"] = bool(raw_json["fSP"])
 
-            if self._has_pir:
-                if TYPE_TO_ITYPE[result["type"]] == ZONE_TYPE.ControlSP:
+            if raw_json["iFlagExpectedKit"] & ZONE_KIT.PIR:  # as per self._has_pir
+                if zone_type == ZONE_TYPE.ControlSP:
                     result["occupied"] = _is_occupied(raw_json)
                 else:
                     result["_occupied"] = _is_occupied(raw_json)
 
-            if raw_json["iType"] in [
-                ZONE_TYPE.OnOffTimer,
-                ZONE_TYPE.ControlSP,
-                ZONE_TYPE.TPI,
-            ]:
+            if zone_type in _TYPES_WITH_OVERRIDE:
                 result["override"] = {}
                 result["override"]["duration"] = raw_json["iBoostTimeRemaining"]
-                if raw_json["iType"] == ZONE_TYPE.OnOffTimer:
+                if zone_type == ZONE_TYPE.OnOffTimer:
                     result["override"]["setpoint"] = raw_json["fBoostSP"] != 0
                 else:
                     result["override"]["setpoint"] = raw_json["fBoostSP"]
 
             result["schedule"] = {"timer": {}, "footprint": {}}  # for all zone types
 
-            if raw_json["iType"] not in [
-                ZONE_TYPE.Manager,
-                ZONE_TYPE.Surrogate,
-            ]:  # timer = {} if: Manager, Group
+            if zone_type not in _TYPES_WITHOUT_TIMER:  # timer = {} if: Manager, Group
                 result["schedule"]["timer"] = _timer_schedule(raw_json)
 
-            if raw_json["iType"] in [ZONE_TYPE.ControlSP]:
+            if zone_type == ZONE_TYPE.ControlSP:
                 # footprint={...} iff: ControlSP, _even_ if no PIR, otherwise ={}
                 result["schedule"]["footprint"] = _footprint_schedule(raw_json)
                 result["_schedule"] = {
@@ -570,7 +652,7 @@ class GeniusZone(GeniusObject):
             keys = ["bIsActive", "bOutRequestHeat"]
             result["_state"] = {k: raw_json[k] for k in keys}
 
-            if raw_json["iType"] in [ZONE_TYPE.ControlSP]:
+            if zone_type == ZONE_TYPE.ControlSP:
                 key = "bInHeatEnabled"
                 result["_state"][key] = raw_json[key]
 
@@ -628,13 +710,11 @@ class GeniusZone(GeniusObject):
             "Zone(%s).set_mode(mode=%s, mode_str='%s')...", self.id, mode, mode_str
         )
 
-        if self._hub.api_version == 1:
-            url = f"zones/{self.id}/mode"  # v1 API uses strings
+        if self._hub.api_version == 1:  # v1 API uses strings
+            url = f"zones/{self.id}/mode"
             resp = await self._hub.request("PUT", url, data=mode_str)
-        else:  # self._hub.api_version == 3
-            url = (
-                f"zone/{self.id}"
-            )  # v3 API uses dicts  # TODO: check: is it PUT(POST?) vs PATCH
+        else:  # self._hub.api_version == 3, v3 API uses dicts
+            url = f"zone/{self.id}"  # TODO: check: is it PUT(POST?) vs PATCH
             resp = await self._hub.request("PATCH", url, data={"iMode": mode})
 
         if resp:  # for v1, resp = None?
@@ -678,8 +758,12 @@ class GeniusZone(GeniusObject):
 class GeniusDevice(GeniusObject):
     """The class for a Genius Device."""
 
+    __slots__ = ()
+
+    _info_keys = _keys_by_verbosity(ATTRS_DEVICE)
+
     def __init__(self, device_id, raw_json, hub) -> None:
-        super().__init__(hub, ATTRS_DEVICE)
+        super().__init__(hub)
 
         self.id = device_id  # pylint: disable=invalid-name
 
@@ -708,13 +792,13 @@ class GeniusDevice(GeniusObject):
                 result["type"] = None
 
             result["assignedZones"] = [{"name": None}]
-            if node["location"]["val"]:
-                result["assignedZones"] = [{"name": node["location"]["val"]}]
+            location = node["location"]["val"]
+            if location:
+                result["assignedZones"] = [{"name": location}]
 
-            result["state"] = state = {}
-            state.update(
-                [(v, node[k]["val"]) for k, v in STATE_ATTRS.items() if k in node]
-            )
+            result["state"] = state = {
+                v: node[k]["val"] for k, v in STATE_ATTRS.items() if k in node
+            }
             if "outputOnOff" in state:  # this one should be a bool
                 state["outputOnOff"] = bool(state["outputOnOff"])
 
@@ -725,7 +809,7 @@ class GeniusDevice(GeniusObject):
 
         try:
             result["_state"] = _state = {}
-            for val in ["lastComms", "setback"]:
+            for val in ("lastComms", "setback"):
                 if val in node:
                     _state[val] = node[val]["val"]
             if "WakeUp_Interval" in node:
@@ -734,7 +818,7 @@ class GeniusDevice(GeniusObject):
             node = raw_json["childNodes"]["_cfg"]["childValues"]
 
             result["_config"] = _config = {}
-            for val in ["max_sp", "min_sp", "sku"]:
+            for val in ("max_sp", "min_sp", "sku"):
                 if val in node:
                     _config[val] = node[val]["val"]
 